@@ -5,29 +5,168 @@ Versión: DEDSEC001
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import time
 import re
-import csv
 from datetime import datetime
 from urllib.parse import quote
 import concurrent.futures
-from dataclasses import dataclass
-from typing import List, Dict, Optional
-import hashlib
-import base64
+import threading
+from itertools import chain
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2 as html_re
+except ImportError:
+    html_re = re
+
+_PLATFORMS: Dict[str, Tuple[str, str]] = {
+    'twitter': ('twitter.com', '/%s'),
+    'instagram': ('www.instagram.com', '/%s'),
+    'facebook': ('www.facebook.com', '/%s'),
+    'linkedin': ('www.linkedin.com', '/in/%s'),
+    'github': ('github.com', '/%s'),
+    'pinterest': ('www.pinterest.com', '/%s'),
+    'tiktok': ('www.tiktok.com', '/@%s'),
+    'behance': ('www.behance.net', '/%s'),
+    'dribbble': ('dribbble.com', '/%s'),
+    'medium': ('medium.com', '/@%s'),
+    'youtube': ('www.youtube.com', '/user/%s'),
+    'reddit': ('www.reddit.com', '/user/%s'),
+    'telegram': ('t.me', '/%s'),
+    'twitch': ('www.twitch.tv', '/%s'),
+    'snapchat': ('www.snapchat.com', '/add/%s')
+}
+
+_NOT_FOUND_PATTERNS = {
+    'twitter': ["this account doesn't exist", "account suspended", "profile not found"],
+    'instagram': ["page not found", "user not found", "sorry, this page isn't available"],
+    'facebook': ["page not found", "content not found", "profile not available"],
+    'linkedin': ["page not found", "member not found", "profile not found"],
+    'tiktok': ["couldn't find this account", "no content found"],
+    'youtube': ["channel doesn't exist", "user not found"],
+    'telegram': ["username not found", "user not found"],
+    'twitch': ["page not found", "user not found"],
+    'snapchat': ["page not found", "user not found"]
+}
+
+# Todas las frases son literales ASCII: se buscan como bytes sobre cada trozo del
+# cuerpo en minúsculas, sin decodificar la respuesta ni pasar por el motor de regex. Sobre
+# 64KB, unir las frases en una sola alternancia con re.IGNORECASE es ~15 veces
+# más lento que estas búsquedas con `in`, y un DFA (re2) solo las iguala: con
+# tres frases por plataforma como máximo no compensa una dependencia nativa.
+_NOT_FOUND_LITERALS = {
+    platform: tuple(p.lower().encode('ascii') for p in patterns)
+    for platform, patterns in _NOT_FOUND_PATTERNS.items()
+}
+
+# Plataformas que devuelven un 404 limpio para usuarios inexistentes: el código
+# de estado basta y se consultan con HEAD. El resto responde 200 con una página
+# de "no encontrado" y la existencia solo se puede decidir leyendo el cuerpo.
+_STATUS_ONLY = frozenset({'github', 'reddit', 'medium', 'pinterest', 'behance', 'dribbble'})
+
+# Sondeos simultáneos: un barrido completo (usuario principal y variantes) se
+# encola de una vez, pero cada host recibe como mucho _PER_HOST_CONCURRENCY
+# peticiones a la vez para no provocar límites de tasa. Con más hilos que hosts,
+# cada host tiene siempre un sondeo esperando turno cuando termina el anterior.
+_MAX_CONCURRENCY = 32
+_PER_HOST_CONCURRENCY = 1
+
+# (conexión, lectura): un host caído no debe retener el barrido completo durante
+# los 10 s de lectura que sí se conceden a un servidor lento.
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Respuestas de servidores que no aceptan HEAD: se repite la petición con GET.
+_HEAD_UNSUPPORTED = frozenset({405, 501})
+
+# Únicos códigos que responden a la pregunta "¿existe la cuenta?". Cualquier otro
+# (429, 403, 5xx tras los reintentos...) es un fallo del sondeo: se registra
+# como error y no se guarda en la caché.
+_PROBE_STATUSES = frozenset({200, 404})
+
+# Solo se conservan los primeros 32KB de cada página: <title> y og:* están en el
+# <head>, y la extracción de datos de perfil que dependa del JSON embebido más
+# abajo es, por tanto, aproximada. Los marcadores de "no encontrado" pueden
+# estar en cualquier parte del cuerpo: se buscan en el flujo completo, trozo a
+# trozo, hasta _MAX_SCAN_BYTES, sin retener en memoria más que la cabecera.
+_MAX_BODY_BYTES = 32768
+_MAX_SCAN_BYTES = 2 * 1024 * 1024
+
+_PROFILE_PATTERNS = {
+    field: [html_re.compile('(?i)' + p) for p in patterns]
+    for field, patterns in {
+        'name': [
+            r'<title>([^<]+)</title>',
+            r'"name":\s*"([^"]+)"',
+            r'<meta property="og:title" content="([^"]+)"'
+        ],
+        'description': [
+            r'<meta name="description" content="([^"]+)"',
+            r'<meta property="og:description" content="([^"]+)"',
+            r'"description":\s*"([^"]+)"'
+        ],
+        'followers': [
+            r'(\d+(?:,\d+)*)\s*followers',
+            r'"followers":\s*(\d+)',
+            r'(\d+(?:\.\d+)?[KM]?)\s*followers'
+        ],
+        'location': [
+            r'"location":\s*"([^"]+)"',
+            r'<meta property="og:locale" content="([^"]+)"'
+        ]
+    }.items()
+}
+
+# Campos que solo se buscan dentro del <head>; el resto (y los patrones propios
+# de cada plataforma) viven en el JSON embebido del cuerpo.
+_HEAD_FIELDS = frozenset({'name', 'description'})
+
+_LINKEDIN_HEADLINE_RE = html_re.compile(r'"headline":\s*"([^"]+)"')
+_GITHUB_REPOS_RE = html_re.compile(r'"public_repos":\s*(\d+)')
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_PHONE_RE = re.compile(r'^\+?\d[\d\s-]{7,}$')
+_PHONE_FMT_RE = re.compile(r'\+\d{1,3}\s?\d{3}\s?\d{3}\s?\d{3}\Z')
+
+# Puntuación de confianza: base por existir, más un peso por cada campo de perfil
+# encontrado y una bonificación para plataformas profesionales.
+_BASE_CONFIDENCE = 0.3
+_FIELD_WEIGHTS = (('name', 0.2), ('description', 0.2), ('followers', 0.1), ('location', 0.1))
+_PLATFORM_BONUS = {
+    'linkedin': 0.1,
+    'github': 0.1,
+    'behance': 0.1,
+    'dribbble': 0.1
+}
+
+_BASE_RECOMMENDATIONS = (
+    "Verificar configuraciones de privacidad en todas las plataformas",
+    "Usar nombres de usuario únicos para diferentes propósitos",
+    "Monitorear regularmente la presencia en línea",
+    "Considerar el uso de un gestor de contraseñas"
+)
+
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+@dataclass(slots=True, frozen=True)
 class SocialAccount:
     platform: str
     username: str
     url: str
     exists: bool
-    profile_data: Dict
+    # Un dict no es hashable: se deja fuera del hash para que la cuenta sí lo sea
+    profile_data: Dict = field(hash=False)
     confidence_score: float
+    # Marca de tiempo del lote de búsqueda, no de cada petición individual
     last_checked: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PersonProfile:
     name: str
     email: str
@@ -43,24 +182,28 @@ class OSINTSocialVerifier:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
-        self.platforms = {
-            'twitter': 'https://twitter.com/{}',
-            'instagram': 'https://www.instagram.com/{}',
-            'facebook': 'https://www.facebook.com/{}',
-            'linkedin': 'https://www.linkedin.com/in/{}',
-            'github': 'https://github.com/{}',
-            'pinterest': 'https://www.pinterest.com/{}',
-            'tiktok': 'https://www.tiktok.com/@{}',
-            'behance': 'https://www.behance.net/{}',
-            'dribbble': 'https://dribbble.com/{}',
-            'medium': 'https://medium.com/@{}',
-            'youtube': 'https://www.youtube.com/user/{}',
-            'reddit': 'https://www.reddit.com/user/{}',
-            'telegram': 'https://t.me/{}',
-            'twitch': 'https://www.twitch.tv/{}',
-            'snapchat': 'https://www.snapchat.com/add/{}'
-        }
+        adapter = HTTPAdapter(
+            pool_connections=len(_PLATFORMS),
+            pool_maxsize=_PER_HOST_CONCURRENCY,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                # Un 429 no se reintenta: insistir ante un host que pide esperar
+                # solo trae más 429, y se ignora Retry-After para que un 503 no
+                # detenga el barrido el tiempo que indique el servidor.
+                status_forcelist=(500, 502, 503, 504),
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.platforms = _PLATFORMS
+        # (prefijo, sufijo) de cada URL de perfil; el usuario se inserta entre ambos
+        self._url_builders = {p: tuple(f'https://{host}{path}'.split('%s', 1)) for p, (host, path) in self.platforms.items()}
+        self._host_slots = {host: threading.BoundedSemaphore(_PER_HOST_CONCURRENCY) for host, _ in self.platforms.values()}
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_CONCURRENCY)
         self.results = []
+        self._account_cache: Dict[Tuple[str, str], SocialAccount] = {}
         self.report_data = {
             'timestamp': datetime.now().isoformat(),
             'target_profile': None,
@@ -69,6 +212,18 @@ class OSINTSocialVerifier:
             'recommendations': []
         }
 
+    def close(self, wait: bool = True):
+        # Los sondeos aún en cola se cancelan: cerrar no debe lanzar todas las
+        # peticiones pendientes de un barrido interrumpido.
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(wait=exc_type is None)
+
     def log_error(self, message: str):
         with open("osint_errors.log", "a", encoding="utf-8") as f:
             f.write(f"{datetime.now().isoformat()} - {message}\n")
@@ -85,25 +240,43 @@ class OSINTSocialVerifier:
         }
         print(f"[INFO] Perfil objetivo establecido: {profile.name}")
 
-    def check_username_availability(self, username: str, platform: str) -> SocialAccount:
-        url = self.platforms[platform].format(username)
+    def check_username_availability(self, username: str, platform: str, now_iso: Optional[str] = None) -> SocialAccount:
+        cached = self._account_cache.get((username, platform))
+        if cached is not None:
+            return cached
+        prefix, suffix = self._url_builders[platform]
+        url = prefix + quote(username, safe='') + suffix
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
         try:
-            response = self.session.get(url, timeout=10, allow_redirects=True)
-            exists = self._analyze_response(response, platform)
+            exists = False
             profile_data = {}
             confidence_score = 0.0
+            with self._host_slots[self.platforms[platform][0]]:
+                fetch = True
+                if platform in _STATUS_ONLY:
+                    response = self.session.head(url, timeout=_REQUEST_TIMEOUT, allow_redirects=True)
+                    fetch = response.status_code == 200 or response.status_code in _HEAD_UNSUPPORTED
+                    if not fetch:
+                        self._check_probe_status(response)
+                if fetch:
+                    literals = _NOT_FOUND_LITERALS.get(platform, ())
+                    status_code, body, encoding, not_found = self._get_limited(url, literals)
+                    exists = status_code == 200 and not not_found
             if exists:
-                profile_data = self._extract_profile_data(response, platform)
+                profile_data = self._extract_profile_data(self._decode_body(body, encoding), platform)
                 confidence_score = self._calculate_confidence_score(profile_data, platform)
-            return SocialAccount(
+            account = SocialAccount(
                 platform=platform,
                 username=username,
                 url=url,
                 exists=exists,
                 profile_data=profile_data,
                 confidence_score=confidence_score,
-                last_checked=datetime.now().isoformat()
+                last_checked=now_iso
             )
+            self._account_cache[(username, platform)] = account
+            return account
         except requests.RequestException as e:
             error_msg = f"Error al verificar {platform}: {e}"
             print(f"[ERROR] {error_msg}")
@@ -115,117 +288,95 @@ class OSINTSocialVerifier:
                 exists=False,
                 profile_data={},
                 confidence_score=0.0,
-                last_checked=datetime.now().isoformat()
+                last_checked=now_iso
             )
 
+    def _get_limited(self, url: str, literals: Tuple[bytes, ...] = ()) -> Tuple[int, bytes, Optional[str], bool]:
+        with self.session.get(url, timeout=_REQUEST_TIMEOUT, allow_redirects=True, stream=True) as response:
+            if response.status_code != 200:
+                self._check_probe_status(response)
+                return response.status_code, b'', response.encoding, False
+            limit = _MAX_SCAN_BYTES if literals else _MAX_BODY_BYTES
+            overlap = max(len(literal) for literal in literals) - 1 if literals else 0
+            chunks = []
+            size = 0
+            tail = b''
+            for chunk in response.iter_content(_MAX_BODY_BYTES):
+                if size < _MAX_BODY_BYTES:
+                    chunks.append(chunk)
+                size += len(chunk)
+                if literals:
+                    # Se conserva el final del trozo anterior para no perder una
+                    # frase partida entre dos trozos.
+                    window = tail + chunk.lower()
+                    if any(literal in window for literal in literals):
+                        return response.status_code, b'', response.encoding, True
+                    tail = window[-overlap:]
+                if size >= limit:
+                    break
+            return response.status_code, b''.join(chunks)[:_MAX_BODY_BYTES], response.encoding, False
+
+    def _check_probe_status(self, response: requests.Response):
+        if response.status_code not in _PROBE_STATUSES:
+            raise requests.HTTPError(f"respuesta HTTP {response.status_code} de {response.url}", response=response)
+
+    def _decode_body(self, body: bytes, encoding: Optional[str]) -> str:
+        try:
+            return body.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
+
     def search_all_platforms(self, username: str) -> List[SocialAccount]:
+        return self._collect_probes(self._start_search(username, datetime.now().isoformat()))
+
+    def _start_search(self, username: str, now_iso: str) -> List[concurrent.futures.Future]:
         print(f"[INFO] Buscando usuario: {username}")
+        return self._enqueue_probes(username, now_iso)
+
+    def _enqueue_probes(self, username: str, now_iso: str) -> List[concurrent.futures.Future]:
+        return [self._executor.submit(self.check_username_availability, username, platform, now_iso) for platform in self.platforms]
+
+    def _collect_probes(self, futures: List[concurrent.futures.Future]) -> List[SocialAccount]:
         results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_platform = {executor.submit(self.check_username_availability, username, platform): platform for platform in self.platforms}
-            for future in concurrent.futures.as_completed(future_to_platform):
-                account = future.result()
-                if account.exists:
-                    print(f"[FOUND] {account.platform}: {account.url}")
-                    results.append(account)
-                    self.report_data['found_accounts'].append({
-                        'platform': account.platform,
-                        'username': username,
-                        'url': account.url,
-                        'confidence_score': account.confidence_score,
-                        'profile_data': account.profile_data
-                    })
+        for future in concurrent.futures.as_completed(futures):
+            account = future.result()
+            if account.exists:
+                print(f"[FOUND] {account.platform}: {account.url}")
+                results.append(account)
+        self.report_data['found_accounts'].extend({
+            'platform': account.platform,
+            'username': account.username,
+            'url': account.url,
+            'confidence_score': account.confidence_score,
+            'profile_data': dict(account.profile_data)
+        } for account in results)
         return results
 
-    def _analyze_response(self, response: requests.Response, platform: str) -> bool:
-        if response.status_code == 200:
-            content = response.text.lower()
-            not_found_patterns = {
-                'twitter': ["this account doesn't exist", "account suspended", "profile not found"],
-                'instagram': ["page not found", "user not found", "sorry, this page isn't available"],
-                'facebook': ["page not found", "content not found", "profile not available"],
-                'linkedin': ["page not found", "member not found", "profile not found"],
-                'github': ["not found", "404", "doesn't exist"],
-                'pinterest': ["page not found", "profile not found"],
-                'tiktok': ["couldn't find this account", "no content found"],
-                'behance': ["page not found", "profile not found"],
-                'dribbble': ["page not found", "profile not found"],
-                'medium': ["page not found", "profile not found"],
-                'youtube': ["channel doesn't exist", "404", "user not found"],
-                'reddit': ["page not found", "user not found"],
-                'telegram': ["username not found", "user not found"],
-                'twitch': ["page not found", "user not found"],
-                'snapchat': ["page not found", "user not found"]
-            }
-            if platform in not_found_patterns:
-                for pattern in not_found_patterns[platform]:
-                    if pattern in content:
-                        return False
-            return True
-        return False
-
-    def _extract_profile_data(self, response: requests.Response, platform: str) -> Dict:
-        content = response.text
+    def _extract_profile_data(self, content: str, platform: str) -> Dict:
+        head_end = content.find('</head>')
+        if head_end == -1:
+            head_end = len(content)
         profile_data = {}
-        patterns = {
-            'name': [
-                r'<title>([^<]+)</title>',
-                r'"name":\s*"([^"]+)"',
-                r'<meta property="og:title" content="([^"]+)"'
-            ],
-            'description': [
-                r'<meta name="description" content="([^"]+)"',
-                r'<meta property="og:description" content="([^"]+)"',
-                r'"description":\s*"([^"]+)"'
-            ],
-            'followers': [
-                r'(\d+(?:,\d+)*)\s*followers',
-                r'"followers":\s*(\d+)',
-                r'(\d+(?:\.\d+)?[KM]?)\s*followers'
-            ],
-            'location': [
-                r'"location":\s*"([^"]+)"',
-                r'<meta property="og:locale" content="([^"]+)"'
-            ]
-        }
-        for field, regex_list in patterns.items():
-            for pattern in regex_list:
-                match = re.search(pattern, content, re.IGNORECASE)
+        for field, regex_list in _PROFILE_PATTERNS.items():
+            endpos = head_end if field in _HEAD_FIELDS else len(content)
+            for rx in regex_list:
+                match = rx.search(content, 0, endpos)
                 if match:
                     profile_data[field] = match.group(1)
                     break
         if platform == 'linkedin':
-            job_pattern = r'"headline":\s*"([^"]+)"'
-            job_match = re.search(job_pattern, content)
+            job_match = _LINKEDIN_HEADLINE_RE.search(content)
             if job_match:
                 profile_data['job_title'] = job_match.group(1)
         elif platform == 'github':
-            repo_pattern = r'"public_repos":\s*(\d+)'
-            repo_match = re.search(repo_pattern, content)
+            repo_match = _GITHUB_REPOS_RE.search(content)
             if repo_match:
                 profile_data['public_repos'] = repo_match.group(1)
         return profile_data
 
     def _calculate_confidence_score(self, profile_data: Dict, platform: str) -> float:
-        score = 0.0
-        score += 0.3
-        if profile_data.get('name'):
-            score += 0.2
-        if profile_data.get('description'):
-            score += 0.2
-        if profile_data.get('followers'):
-            score += 0.1
-        if profile_data.get('location'):
-            score += 0.1
-        platform_bonus = {
-            'linkedin': 0.1,  
-            'github': 0.1,   
-            'behance': 0.1,  
-            'dribbble': 0.1  
-        }
-        if platform in platform_bonus:
-            score += platform_bonus[platform]
-        return min(score, 1.0)
+        score = sum((weight for field, weight in _FIELD_WEIGHTS if profile_data.get(field)), _BASE_CONFIDENCE)
+        return min(score + _PLATFORM_BONUS.get(platform, 0.0), 1.0)
 
     def search_email_presence(self, email: str) -> Dict:
         print(f"[INFO] Buscando email: {email}")
@@ -248,37 +399,43 @@ class OSINTSocialVerifier:
             'telegram_found': False,
             'public_listings': []
         }
-        if re.match(r'^\+\d{1,3}\s?\d{3}\s?\d{3}\s?\d{3}$', phone):
-            results['format_valid'] = True
-        else:
-            results['format_valid'] = False
+        results['format_valid'] = bool(_PHONE_FMT_RE.match(phone))
         return results
 
     def generate_username_variants(self, base_username: str) -> List[str]:
-        variants = [base_username]
-        variants.extend([
+        variants = [
+            base_username,
+            base_username.replace('_', ''),
+            base_username.replace('_', '.'),
+            base_username.replace('_', '-'),
             base_username + '1',
             base_username + '2',
+            base_username + '123',
             base_username + '_',
             base_username + '.',
             base_username + '-',
-            base_username + '123',
-            base_username.replace('_', ''),
-            base_username.replace('_', '.'),
-            base_username.replace('_', '-'),
-        ])
-        return list(set(variants))
+        ]
+        return list(dict.fromkeys(variants))
 
     def comprehensive_search(self, profile: PersonProfile) -> Dict:
         print(f"[INFO] Iniciando búsqueda comprensiva para: {profile.name}")
         self.set_target_profile(profile)
-        main_results = self.search_all_platforms(profile.common_username)
-        variants = self.generate_username_variants(profile.common_username)
-        variant_results = []
+        self._account_cache.clear()
+        now_iso = datetime.now().isoformat()
+        main_futures = self._start_search(profile.common_username, now_iso)
+        variants = [v for v in self.generate_username_variants(profile.common_username) if v != profile.common_username]
+        variant_futures = []
         for variant in variants[:5]:
-            if variant != profile.common_username:
-                print(f"[INFO] Probando variante: {variant}")
-                variant_results.extend(self.search_all_platforms(variant))
+            print(f"[INFO] Probando variante: {variant}")
+            variant_futures.extend(self._enqueue_probes(variant, now_iso))
+        # Si la recogida se interrumpe, los sondeos aún en cola no llegan a lanzarse.
+        try:
+            main_results = self._collect_probes(main_futures)
+            variant_results = self._collect_probes(variant_futures)
+        except BaseException:
+            for future in chain(main_futures, variant_futures):
+                future.cancel()
+            raise
         email_results = self.search_email_presence(profile.email)
         phone_results = self.search_phone_presence(profile.phone)
         self.report_data['verification_summary'] = {
@@ -287,7 +444,7 @@ class OSINTSocialVerifier:
             'email_verification': email_results,
             'phone_verification': phone_results,
             'total_accounts_found': len(main_results) + len(variant_results),
-            'high_confidence_accounts': len([r for r in main_results + variant_results if r.confidence_score > 0.7])
+            'high_confidence_accounts': sum(1 for r in chain(main_results, variant_results) if r.confidence_score > 0.7)
         }
         self._generate_recommendations()
         return self.report_data
@@ -299,45 +456,52 @@ class OSINTSocialVerifier:
             recommendations.append("Alto número de cuentas encontradas - considerar auditar perfiles no utilizados")
         if total_accounts > 5:
             recommendations.append("Implementar autenticación de dos factores en todas las cuentas")
-        recommendations.extend([
-            "Verificar configuraciones de privacidad en todas las plataformas",
-            "Usar nombres de usuario únicos para diferentes propósitos",
-            "Monitorear regularmente la presencia en línea",
-            "Considerar el uso de un gestor de contraseñas"
-        ])
+        recommendations.extend(_BASE_RECOMMENDATIONS)
         self.report_data['recommendations'] = recommendations
 
     def export_results_csv(self, filename: str = None):
+        # csv solo se necesita al exportar; se importa aquí para no retrasar el arranque
+        import csv
         if not filename:
             filename = f"osint_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        if orjson is not None:
+            def encode(data):
+                return orjson.dumps(data).decode('utf-8')
+        else:
+            encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as csvfile:
             fieldnames = ['platform', 'username', 'url', 'exists', 'confidence_score', 'profile_data']
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            for account in self.report_data['found_accounts']:
-                writer.writerow({
-                    'platform': account['platform'],
-                    'username': account['username'],
-                    'url': account['url'],
-                    'exists': True,
-                    'confidence_score': account['confidence_score'],
-                    'profile_data': json.dumps(account['profile_data'])
-                })
+            writer.writerows({
+                'platform': account['platform'],
+                'username': account['username'],
+                'url': account['url'],
+                'exists': True,
+                'confidence_score': account['confidence_score'],
+                'profile_data': encode(account['profile_data'])
+            } for account in self.report_data['found_accounts'])
         print(f"[INFO] Resultados exportados a: {filename}")
 
     def export_results_json(self, filename: str = None):
         if not filename:
             filename = f"osint_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(self.report_data, jsonfile, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as jsonfile:
+                jsonfile.write(orjson.dumps(self.report_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as jsonfile:
+                json.dump(self.report_data, jsonfile, indent=2, ensure_ascii=False)
         print(f"[INFO] Reporte completo exportado a: {filename}")
 
     def export_results_txt(self, filename: str = None):
         if not filename:
             filename = f"osint_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        with open(filename, 'w', encoding='utf-8') as f:
-            for account in self.report_data['found_accounts']:
-                f.write(f"{account['platform']}: {account['url']} (Confianza: {account['confidence_score']})\n")
+        with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.writelines(
+                f"{account['platform']}: {account['url']} (Confianza: {account['confidence_score']})\n"
+                for account in self.report_data['found_accounts']
+            )
         print(f"[INFO] Resultados exportados a: {filename}")
 
     def print_summary(self):
@@ -362,11 +526,13 @@ class OSINTSocialVerifier:
             print(f"  {i}. {rec}")
         print("="*60)
 
-    def validate_email(self, email: str) -> bool:
-        return bool(re.match(r"[^@]+@[^@]+\.[^@]+", email))
+    @staticmethod
+    def validate_email(email: str) -> bool:
+        return bool(_EMAIL_RE.match(email))
 
-    def validate_phone(self, phone: str) -> bool:
-        return bool(re.match(r'^\+?\d[\d\s-]{7,}$', phone))
+    @staticmethod
+    def validate_phone(phone: str) -> bool:
+        return bool(_PHONE_RE.match(phone))
 
 
 def get_user_input():
@@ -378,10 +544,10 @@ def get_user_input():
         print(" El nombre es obligatorio")
         return None
     email = input("Email (opcional): ").strip()
-    if email and not OSINTSocialVerifier().validate_email(email):
+    if email and not OSINTSocialVerifier.validate_email(email):
         print(" Email parece inválido")
     phone = input("Teléfono (opcional): ").strip()
-    if phone and not OSINTSocialVerifier().validate_phone(phone):
+    if phone and not OSINTSocialVerifier.validate_phone(phone):
         print(" Teléfono parece inválido")
     location = input("Ubicación (opcional): ").strip()
     profession = input("Profesión (opcional): ").strip()
@@ -414,7 +580,6 @@ def use_example_profile():
 def main():
     print("Herramienta OSINT para Verificación de Redes Sociales")
     print("="*55)
-    verifier = OSINTSocialVerifier()
     print("\nSelecciona una opción:")
     print("1. Ingresar datos manualmente")
     print("2. Usar perfil de ejemplo (María Elena Rodríguez)")
@@ -448,21 +613,22 @@ def main():
         return
     print(f"\n Iniciando búsqueda OSINT para: {profile.name}")
     print(" Esto puede tomar varios minutos...")
-    results = verifier.comprehensive_search(profile)
-    verifier.print_summary()
-    export_choice = input("\n¿Exportar resultados? (s/n): ").strip().lower()
-    if export_choice in ['s', 'si', 'y', 'yes']:
-        format_choice = input("¿Formato de exportación? (csv/json/txt): ").strip().lower()
-        if format_choice == "csv":
-            verifier.export_results_csv()
-        elif format_choice == "json":
-            verifier.export_results_json()
-        elif format_choice == "txt":
-            verifier.export_results_txt()
-        else:
-            print("Formato no reconocido, exportando por defecto en CSV.")
-            verifier.export_results_csv()
-        print(" Resultados exportados exitosamente")
+    with OSINTSocialVerifier() as verifier:
+        results = verifier.comprehensive_search(profile)
+        verifier.print_summary()
+        export_choice = input("\n¿Exportar resultados? (s/n): ").strip().lower()
+        if export_choice in ['s', 'si', 'y', 'yes']:
+            format_choice = input("¿Formato de exportación? (csv/json/txt): ").strip().lower()
+            if format_choice == "csv":
+                verifier.export_results_csv()
+            elif format_choice == "json":
+                verifier.export_results_json()
+            elif format_choice == "txt":
+                verifier.export_results_txt()
+            else:
+                print("Formato no reconocido, exportando por defecto en CSV.")
+                verifier.export_results_csv()
+            print(" Resultados exportados exitosamente")
     print("\n Búsqueda completada.")
 
 if __name__ == "__main__":